@@ -1,25 +1,62 @@
 from __future__ import annotations
 
+import atexit
+import logging
+import queue
+import traceback
+from logging.handlers import QueueHandler, QueueListener
 from typing import Optional
 
+import orjson
+import pandas as pd
 from fastapi import FastAPI, File, HTTPException, UploadFile
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from dotenv import load_dotenv
 
 try:
     from backend.pipeline.graph import build_graph
-    from backend.utils.csv_utils import read_csv_bytes
+    from backend.utils.csv_utils import read_csv_file
     from backend.utils.ai_utils import generate_ai_insights
 except ImportError:
     from pipeline.graph import build_graph
-    from utils.csv_utils import read_csv_bytes
+    from utils.csv_utils import read_csv_file
     from utils.ai_utils import generate_ai_insights
 
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
+
+def _configure_logging() -> None:
+    if logger.handlers:
+        return
+    # Handlers write from a background thread; request code only enqueues records.
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    stream = logging.StreamHandler()
+    stream.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s"))
+    listener = QueueListener(log_queue, stream, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+    logger.addHandler(QueueHandler(log_queue))
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+
+
+_configure_logging()
+
 app = FastAPI(title="Data Quality Guardrails")
 
+
+def _json_default(obj):
+    # orjson handles NaN and NumPy scalars itself; this covers pd.NA/NaT and other stragglers.
+    if pd.api.types.is_scalar(obj) and pd.isna(obj):
+        return None
+    if isinstance(obj, pd.Timestamp):
+        return obj.isoformat()
+    return str(obj)
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
@@ -39,15 +76,14 @@ async def add_process_time_header(request, call_next):
 
 @app.exception_handler(Exception)
 async def global_exception_handler(request, exc):
-    import traceback
-    print(f"ERROR: {str(exc)}")
-    print(traceback.format_exc())
+    tb = traceback.format_exc()
+    logger.error("Unhandled error: %s\n%s", exc, tb)
     return JSONResponse(
         status_code=500,
         content={
             "detail": str(exc),
             "type": type(exc).__name__,
-            "traceback": traceback.format_exc()
+            "traceback": tb
         },
     )
 
@@ -75,46 +111,48 @@ async def analyze(
     dataset: UploadFile = File(...),
     baseline: Optional[UploadFile] = File(None),
 ):
-    print(f"Analyze request received: dataset={dataset.filename}")
-    dataset_bytes = await dataset.read()
-    baseline_bytes = await baseline.read() if baseline else None
+    logger.info("Analyze request received: dataset=%s", dataset.filename)
 
+    # Parse straight from the spooled upload in a worker thread: no second
+    # in-memory copy of the body and the event loop stays free.
     try:
-        df = read_csv_bytes(dataset_bytes)
-        print(f"Dataset loaded: {len(df)} rows")
+        df = await run_in_threadpool(read_csv_file, dataset.file)
+        logger.info("Dataset loaded: %d rows", len(df))
     except Exception as exc: 
-        print(f"Failed to read dataset: {exc}")
+        logger.warning("Failed to read dataset: %s", exc)
         raise HTTPException(status_code=400, detail=f"Invalid dataset CSV: {exc}") from exc
 
     baseline_df = None
-    if baseline_bytes:
+    if baseline is not None and baseline.size != 0:
         try:
-            baseline_df = read_csv_bytes(baseline_bytes)
-            print(f"Baseline loaded: {len(baseline_df)} rows")
+            baseline_df = await run_in_threadpool(read_csv_file, baseline.file)
+            logger.info("Baseline loaded: %d rows", len(baseline_df))
         except Exception as exc:
-            print(f"Failed to read baseline: {exc}")
+            logger.warning("Failed to read baseline: %s", exc)
             raise HTTPException(status_code=400, detail=f"Invalid baseline CSV: {exc}") from exc
 
-    print("Running pipeline...")
+    logger.info("Running pipeline")
     try:
         result = pipeline.invoke({"dataset": df, "baseline": baseline_df, "report": {}})
         report = result["report"]
     except Exception as exc:
-        print(f"Pipeline error: {exc}")
+        logger.error("Pipeline error: %s", exc)
         raise exc
 
-    print("Generating AI insights...")
+    logger.info("Generating AI insights")
     try:
         report["ai_insights"] = generate_ai_insights(report)
     except Exception as exc:
-        print(f"AI insights error: {exc}")
+        logger.warning("AI insights error: %s", exc)
         report["ai_insights"] = {"status": "error", "reason": str(exc)}
 
     report["sample_columns"] = list(df.columns)
-    # Handle NaNs for JSON serialization
-    sample_df = df.head(20).replace({np.nan: None})
-    report["sample_rows"] = sample_df.to_dict(orient="records")
-    
-    print("Analysis complete.")
-    from fastapi.encoders import jsonable_encoder
-    return JSONResponse(content=jsonable_encoder(report))
+    report["sample_rows"] = df.head(20).to_dict(orient="records")
+
+    logger.info("Analysis complete")
+    content = orjson.dumps(
+        report,
+        default=_json_default,
+        option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+    )
+    return Response(content=content, media_type="application/json")
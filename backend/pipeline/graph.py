@@ -1,15 +1,15 @@
 from __future__ import annotations
 
-from typing import Any, Dict, Optional, TypedDict
+from typing import Annotated, Any, Dict, Optional, TypedDict
 
 import pandas as pd
-from langgraph.graph import END, StateGraph
+from langgraph.graph import END, START, StateGraph
 
 try:
     from backend.utils.stats_utils import (
         detect_drift,
         detect_schema_violations,
-        infer_column_type,
+        infer_all_columns,
         profile_dataframe,
         recommend_fixes,
         summarize_report,
@@ -18,51 +18,47 @@ except ImportError:
     from utils.stats_utils import (
         detect_drift,
         detect_schema_violations,
-        infer_column_type,
+        infer_all_columns,
         profile_dataframe,
         recommend_fixes,
         summarize_report,
     )
 
 
+def merge_reports(left: Dict[str, Any], right: Dict[str, Any]) -> Dict[str, Any]:
+    """Combine report sections written by nodes that run in the same step."""
+    return {**(left or {}), **(right or {})}
+
+
 class PipelineState(TypedDict, total=False):
     dataset: pd.DataFrame
     baseline: Optional[pd.DataFrame]
-    report: Dict[str, Any]
+    # Nodes return only the sections they own; merge_reports folds them together.
+    report: Annotated[Dict[str, Any], merge_reports]
 
 
 def profile_node(state: PipelineState) -> PipelineState:
-    profile = profile_dataframe(state["dataset"])
-    report = state.get("report", {})
-    report["profile"] = profile
-    return {"report": report}
+    return {"report": {"profile": profile_dataframe(state["dataset"])}}
 
 
 def schema_node(state: PipelineState) -> PipelineState:
     df = state["dataset"]
-    inferred = {col: infer_column_type(df[col])[0] for col in df.columns}
+    inferred = infer_all_columns(df)
     violations = detect_schema_violations(df, inferred)
-    report = state.get("report", {})
-    report["schema"] = {"inferred": inferred, "violations": violations}
-    return {"report": report}
+    return {"report": {"schema": {"inferred": inferred, "violations": violations}}}
 
 
 def drift_node(state: PipelineState) -> PipelineState:
-    report = state.get("report", {})
     baseline = state.get("baseline")
-    if baseline is not None:
-        report["drift"] = detect_drift(state["dataset"], baseline)
-    else:
-        report["drift"] = None
-    return {"report": report}
+    drift = detect_drift(state["dataset"], baseline) if baseline is not None else None
+    return {"report": {"drift": drift}}
 
 
 def fix_node(state: PipelineState) -> PipelineState:
     report = state.get("report", {})
     recommendations = recommend_fixes(report.get("profile", {}), report.get("schema", {}))
-    report["recommendations"] = recommendations
-    report["summary"] = summarize_report(report)
-    return {"report": report}
+    summary = summarize_report({**report, "recommendations": recommendations})
+    return {"report": {"recommendations": recommendations, "summary": summary}}
 
 
 def build_graph():
@@ -72,9 +68,11 @@ def build_graph():
     graph.add_node("drift", drift_node)
     graph.add_node("fix", fix_node)
 
-    graph.set_entry_point("profile")
-    graph.add_edge("profile", "schema")
-    graph.add_edge("schema", "drift")
-    graph.add_edge("drift", "fix")
+    # profile, schema and drift only read the input frames and own disjoint
+    # report sections, so they run side by side; fix waits for all three.
+    graph.add_edge(START, "profile")
+    graph.add_edge(START, "schema")
+    graph.add_edge(START, "drift")
+    graph.add_edge(["profile", "schema", "drift"], "fix")
     graph.add_edge("fix", END)
     return graph.compile()
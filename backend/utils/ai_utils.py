@@ -1,8 +1,17 @@
 from __future__ import annotations
 
+import hashlib
 import json
 import os
-from typing import Any, Dict, List
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+_CACHE_MAXSIZE = 256
+_CACHE_TTL_SECONDS = 3600
+_insights_cache: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+_insights_lock = threading.Lock()
 
 
 def _compact_report(report: Dict[str, Any]) -> Dict[str, Any]:
@@ -37,6 +46,35 @@ def _compact_report(report: Dict[str, Any]) -> Dict[str, Any]:
     return compact
 
 
+def _cache_enabled() -> bool:
+    return os.getenv("OPENAI_INSIGHTS_CACHE", "1").lower() not in {"0", "false", "no"}
+
+
+def _cache_key(model: str, content: str) -> str:
+    return hashlib.blake2b(f"{model}\n{content}".encode(), digest_size=16).hexdigest()
+
+
+def _cache_get(key: str) -> Optional[Dict[str, Any]]:
+    with _insights_lock:
+        entry = _insights_cache.get(key)
+        if entry is None:
+            return None
+        stored_at, data = entry
+        if time.monotonic() - stored_at > _CACHE_TTL_SECONDS:
+            del _insights_cache[key]
+            return None
+        _insights_cache.move_to_end(key)
+        return dict(data)
+
+
+def _cache_put(key: str, data: Dict[str, Any]) -> None:
+    with _insights_lock:
+        _insights_cache[key] = (time.monotonic(), dict(data))
+        _insights_cache.move_to_end(key)
+        while len(_insights_cache) > _CACHE_MAXSIZE:
+            _insights_cache.popitem(last=False)
+
+
 def generate_ai_insights(report: Dict[str, Any]) -> Dict[str, Any]:
     api_key = os.getenv("OPENAI_API_KEY")
     if not api_key:
@@ -56,7 +94,6 @@ def generate_ai_insights(report: Dict[str, Any]) -> Dict[str, Any]:
     ]
     configured = os.getenv("OPENAI_MODEL", default_model)
     model_candidates = [configured] + [m for m in fallback_models if m != configured]
-    client = OpenAI(api_key=api_key)
     payload = _compact_report(report)
     system = (
         "You are a data quality assistant. Use only the provided report summary. "
@@ -79,6 +116,17 @@ def generate_ai_insights(report: Dict[str, Any]) -> Dict[str, Any]:
             "tone": "clear, pragmatic",
         },
     }
+    # Serialize once: the same string is the cache key input and the message for every model tried.
+    user_content = json.dumps(user, sort_keys=True, separators=(",", ":"), default=str)
+
+    # Re-analyzing the same data yields the same compact payload; skip the round-trip.
+    cache_key = _cache_key(configured, user_content) if _cache_enabled() else None
+    if cache_key is not None:
+        cached = _cache_get(cache_key)
+        if cached is not None:
+            return cached
+
+    client = OpenAI(api_key=api_key)
 
     last_error = None
     for model in model_candidates:
@@ -87,7 +135,7 @@ def generate_ai_insights(report: Dict[str, Any]) -> Dict[str, Any]:
                 model=model,
                 messages=[
                     {"role": "system", "content": system},
-                    {"role": "user", "content": json.dumps(user)},
+                    {"role": "user", "content": user_content},
                 ],
                 response_format={"type": "json_object"},
             )
@@ -95,6 +143,8 @@ def generate_ai_insights(report: Dict[str, Any]) -> Dict[str, Any]:
             data = json.loads(text)
             data["status"] = "ok"
             data["model_used"] = model
+            if cache_key is not None:
+                _cache_put(cache_key, data)
             return data
         except Exception as exc:  # noqa: BLE001
             last_error = exc
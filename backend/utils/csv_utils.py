@@ -1,14 +1,125 @@
 from __future__ import annotations
 
 import io
-from typing import Optional
+from typing import IO, Any, Callable, Dict, Optional
 
 import pandas as pd
 
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    from pyarrow import csv as pacsv
+except ImportError:  # pragma: no cover - pyarrow is optional
+    pa = None
+    pc = None
+    pacsv = None
+
+# Arrow-backed columns (string[pyarrow], int64[pyarrow], ...) need pandas >= 2.0.
+_ARROW_DTYPES = pa is not None and hasattr(pd, "ArrowDtype")
+
+_ARROW_BLOCK_SIZE = 8 << 20
+# An empty timestamp_parsers list still enables Arrow's built-in ISO-8601
+# inference; a format no cell can match is the only way to switch it off.
+_NO_TIMESTAMP_PARSERS = ["%Y\x01"]
+_INT64_LIMIT = 2.0**63
+_INTEGER_PATTERN = r"^\s*[+-]?\d+\s*$"
+
+
+def _arrow_table(source: Any, column_types: Dict[str, Any]) -> Any:
+    return pacsv.read_csv(
+        source,
+        read_options=pacsv.ReadOptions(use_threads=True, block_size=_ARROW_BLOCK_SIZE),
+        # Quoted newlines otherwise desynchronise the parallel block chunker.
+        parse_options=pacsv.ParseOptions(newlines_in_values=True),
+        # Match pandas: empty strings are missing and timestamps stay as the raw text.
+        convert_options=pacsv.ConvertOptions(
+            strings_can_be_null=True,
+            timestamp_parsers=_NO_TIMESTAMP_PARSERS,
+            column_types=column_types,
+        ),
+    )
+
+
+def _read_csv_arrow(open_source: Callable[[], Any]) -> Optional[pd.DataFrame]:
+    """Parse CSV with the multi-threaded Arrow reader.
+
+    Returns None when the file needs pandas-specific handling.
+    """
+    table = _arrow_table(open_source(), {})
+    if len(set(table.column_names)) != table.num_columns:
+        # pandas de-duplicates repeated headers ("a", "a.1"); leave those files to it.
+        return None
+    if any(pa.types.is_binary(t) or pa.types.is_large_binary(t) for t in table.schema.types):
+        # Not valid UTF-8: let pandas raise the decode error instead of passing bytes on.
+        return None
+    # Arrow still infers dates and times. Dates only match strict YYYY-MM-DD,
+    # so casting them back gives the original text; times do not ("10:00"
+    # would come back as "10:00:00"), so those columns are re-read as strings.
+    as_text = {field.name: pa.string() for field in table.schema if pa.types.is_time(field.type)}
+    # Integers beyond int64 are widened to double, which rounds them. Re-read
+    # any double column reaching that range as text and keep it as text only
+    # if every value is an integer (pandas keeps those exact, as objects).
+    wide = set()
+    for field, column in zip(table.schema, table.columns):
+        if pa.types.is_floating(field.type):
+            bounds = pc.min_max(column).as_py()
+            if bounds["max"] is not None and max(abs(bounds["min"]), abs(bounds["max"])) >= _INT64_LIMIT:
+                wide.add(field.name)
+    as_text.update({name: pa.string() for name in wide})
+    if as_text:
+        table = _arrow_table(open_source(), as_text)
+    for i, field in enumerate(table.schema):
+        if pa.types.is_null(field.type):
+            # All-empty columns: pandas reads these as all-NaN float64.
+            table = table.set_column(i, field.name, table.column(i).cast(pa.float64()))
+        elif pa.types.is_date(field.type):
+            table = table.set_column(i, field.name, table.column(i).cast(pa.string()))
+        elif field.name in wide:
+            column = table.column(i)
+            if not pc.all(pc.match_substring_regex(column, _INTEGER_PATTERN)).as_py():
+                table = table.set_column(i, field.name, column.cast(pa.float64()))
+    types_mapper = pd.ArrowDtype if _ARROW_DTYPES else None
+    return table.to_pandas(types_mapper=types_mapper, self_destruct=True, split_blocks=True)
+
+
+def _read_csv_pandas(source: Any) -> pd.DataFrame:
+    if not _ARROW_DTYPES:
+        return pd.read_csv(source)
+    df = pd.read_csv(source, dtype_backend="pyarrow")
+    # Same as the Arrow path: all-empty columns become float64, not null[pyarrow].
+    for col in df.columns[df.dtypes == pd.ArrowDtype(pa.null())]:
+        df[col] = df[col].astype(pd.ArrowDtype(pa.float64()))
+    return df
+
 
 def read_csv_bytes(content: bytes) -> pd.DataFrame:
     """Read CSV bytes into a DataFrame with reasonable defaults."""
-    return pd.read_csv(io.BytesIO(content))
+    if pacsv is not None:
+        try:
+            df = _read_csv_arrow(lambda: pa.BufferReader(content))
+        except pa.ArrowInvalid:
+            df = None
+        if df is not None:
+            return df
+    return _read_csv_pandas(io.BytesIO(content))
+
+
+def read_csv_file(file: IO[bytes]) -> pd.DataFrame:
+    """Read CSV from a binary file object, streaming it in blocks when pyarrow is available."""
+    def rewind() -> IO[bytes]:
+        file.seek(0)
+        return file
+
+    file.seek(0)
+    if pacsv is not None:
+        try:
+            df = _read_csv_arrow(rewind)
+        except pa.ArrowInvalid:
+            df = None
+        if df is not None:
+            return df
+        file.seek(0)
+    return _read_csv_pandas(file)
 
 
 def read_optional_csv_bytes(content: Optional[bytes]) -> Optional[pd.DataFrame]:
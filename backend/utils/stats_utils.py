@@ -1,11 +1,48 @@
 from __future__ import annotations
 
+import os
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 import numpy as np
 import pandas as pd
 
+try:
+    import numba
+except ImportError:  # pragma: no cover - numba is optional
+    numba = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:  # pragma: no cover - pyarrow is optional
+    pa = None
+    pc = None
+
+# Approximates what pd.to_numeric accepts: decimals, exponents and infinities.
+_NUMERIC_PATTERN = r"^\s*[+-]?(?:(?:\d+\.?\d*|\.\d+)(?:e[+-]?\d+)?|inf|infinity)\s*$"
+_BOOL_TOKENS = frozenset({"true", "false", "0", "1", "yes", "no"})
+# Built once so per-request inference only scans data.
+_ARROW_BOOL_TOKENS = pa.array(sorted(_BOOL_TOKENS)) if pa is not None else None
+# What the default pandas reader names a text column: "object", or "str" on pandas 3.
+_TEXT_DTYPE_NAME = str(pd.Series(["a"]).dtype)
+_DATETIME_FORMATS = (
+    "%Y-%m-%d",
+    "%Y-%m-%d %H:%M",
+    "%Y-%m-%d %H:%M:%S",
+    "%Y-%m-%dT%H:%M",
+    "%Y-%m-%dT%H:%M:%S",
+    # %z also accepts a trailing "Z".
+    "%Y-%m-%d %H:%M:%S%z",
+    "%Y-%m-%dT%H:%M:%S%z",
+    "%Y/%m/%d",
+    "%m/%d/%Y",
+    "%d/%m/%Y",
+)
+# Arrow's strptime has no %f, so fractional seconds are dropped before matching.
+_FRACTIONAL_SECONDS = r"(\d:\d\d)[.,]\d+"
+
 
 @dataclass
 class ColumnProfile:
@@ -19,55 +56,216 @@ class ColumnProfile:
     outlier_count: int
 
 
-def _safe_sample(values: pd.Series, k: int = 5) -> List[Any]:
-    unique = values.dropna().unique().tolist()
+def _as_str(series: pd.Series) -> pd.Series:
+    """Return string values, skipping the object round-trip for Arrow strings."""
+    if isinstance(series.dtype, getattr(pd, "ArrowDtype", ())) and pd.api.types.is_string_dtype(series):
+        return series
+    return series.astype(str)
+
+
+def _coerce_numeric(series: pd.Series) -> np.ndarray:
+    """Coerce to float64 with unparseable values as NaN.
+
+    Arrow-backed results keep NaN distinct from NA, so compare on the ndarray.
+    """
+    if pd.api.types.is_numeric_dtype(series):
+        return series.to_numpy(dtype=np.float64, na_value=np.nan)
+    return pd.to_numeric(series, errors="coerce").to_numpy(dtype=np.float64, na_value=np.nan)
+
+
+def _coerce_datetime(series: pd.Series) -> np.ndarray:
+    """Coerce to naive datetime64[ns] (UTC) with unparseable values as NaT."""
+    return pd.to_datetime(series, errors="coerce", utc=True).to_numpy(dtype="datetime64[ns]")
+
+
+def _is_arrow_backed(series: pd.Series) -> bool:
+    dtype = series.dtype
+    if isinstance(dtype, getattr(pd, "ArrowDtype", ())):
+        return True
+    return isinstance(dtype, pd.StringDtype) and dtype.storage == "pyarrow"
+
+
+def _dtype_name(series: pd.Series) -> str:
+    """Report the dtype the default (NumPy-backed) pandas reader would have given.
+
+    Keeps profile output and the AI prompt independent of the Arrow backend.
+    """
+    dtype = series.dtype
+    if not isinstance(dtype, getattr(pd, "ArrowDtype", ())):
+        return str(dtype)
+    arrow_type = dtype.pyarrow_dtype
+    if pa.types.is_string(arrow_type) or pa.types.is_large_string(arrow_type):
+        return _TEXT_DTYPE_NAME
+    # NumPy ints and bools cannot hold missing values, so pandas widens them.
+    if pa.types.is_integer(arrow_type) and series.hasnans:
+        return "float64"
+    if pa.types.is_boolean(arrow_type) and series.hasnans:
+        return "object"
+    if pa.types.is_integer(arrow_type) or pa.types.is_floating(arrow_type) or pa.types.is_boolean(arrow_type):
+        return str(dtype.numpy_dtype)
+    return str(dtype)
+
+
+def _arrow_values(series: pd.Series) -> Optional[Any]:
+    """Return the column as an Arrow array, or None if it cannot be converted."""
+    if pa is None:
+        return None
+    try:
+        return pa.array(series, from_pandas=True)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        return None
+
+
+def _unique_source(series: pd.Series) -> Optional[Any]:
+    """Arrow array for the unique-value stats of text/object columns, else None.
+
+    Object columns are dictionary-encoded once: the dictionary is then exactly
+    the unique set, in first-seen order, for both the count and the sample.
+    """
+    if not (_is_arrow_backed(series) or series.dtype == object):
+        return None
+    # Columns over one read block arrive as ChunkedArrays; the kernels below take both.
+    values = _arrow_values(series)
+    if values is None:
+        return None
+    if pa.types.is_dictionary(values.type):
+        # Native dictionaries may carry unused entries; only trust ones we build.
+        values = values.cast(values.type.value_type)
+    if series.dtype == object and isinstance(values, pa.Array):
+        return pc.dictionary_encode(values)
+    return values
+
+
+def _distinct_values(values: Any) -> Any:
+    """Non-null unique values in first-seen order, from one hash pass.
+
+    Both the unique count and the sample are read off this, so large columns
+    are hashed once rather than once per statistic.
+    """
+    if pa.types.is_dictionary(values.type):
+        return values.dictionary.drop_null()
+    # Also covers all-empty null[pyarrow] columns, which count_distinct rejects.
+    return pc.unique(values).drop_null()
+
+
+def _count_unique(series: pd.Series, uniques: Optional[Any] = None) -> int:
+    """Exact distinct non-null count, hashed in Arrow instead of Python objects."""
+    if uniques is not None:
+        return len(uniques)
+    return int(series.nunique(dropna=True))
+
+
+def _safe_sample(series: pd.Series, k: int = 5, uniques: Optional[Any] = None) -> List[Any]:
+    if uniques is not None:
+        # Only the first k uniques reach Python, not the whole unique set.
+        return uniques.slice(0, k).to_pylist()
+    unique = series.dropna().unique().tolist()
     return unique[:k]
 
 
-def _iqr_outliers(series: pd.Series) -> int:
-    if series.empty:
+def _nan_stats(values: np.ndarray, valid: np.ndarray) -> Tuple[int, float, float, float, float]:
+    """Return (count, min, max, mean, std) for a float column and its NaN-free slice.
+
+    Plain numpy: its pairwise sums avoid the last-digit noise of a single-pass
+    kernel, and reports stay identical with or without numba.
+    """
+    if not valid.size:
+        return 0, np.nan, np.nan, np.nan, np.nan
+    if valid.size == values.size:
+        return int(valid.size), valid.min(), valid.max(), valid.mean(), valid.std()
+    # With gaps, nanmean/nanstd sum the zero-filled column; summing the slice
+    # instead rounds differently in the last digit.
+    return int(valid.size), valid.min(), valid.max(), np.nanmean(values), np.nanstd(values)
+
+
+if numba is not None:
+    @numba.njit(nogil=True)
+    def _count_outside(values, lower, upper):  # pragma: no cover - compiled
+        count = 0
+        for x in values:
+            if x < lower or x > upper:
+                count += 1
+        return count
+else:
+    def _count_outside(values: np.ndarray, lower: float, upper: float) -> int:
+        return int(np.count_nonzero((values < lower) | (values > upper)))
+
+
+def _quartiles(values: np.ndarray) -> Tuple[float, float]:
+    """Q1/Q3 with numpy's default linear interpolation from a single partition."""
+    last = values.size - 1
+    positions = (0.25 * last, 0.75 * last)
+    lows = [int(np.floor(p)) for p in positions]
+    highs = [min(low + 1, last) for low in lows]
+    part = np.partition(values, sorted(set(lows + highs)))
+    q1, q3 = (
+        part[low] + (p - low) * (part[high] - part[low])
+        for p, low, high in zip(positions, lows, highs)
+    )
+    return float(q1), float(q3)
+
+
+def _iqr_outliers(values: np.ndarray) -> int:
+    """Count IQR outliers in an array that is already NaN-free."""
+    if not values.size:
         return 0
-    q1 = series.quantile(0.25)
-    q3 = series.quantile(0.75)
+    q1, q3 = _quartiles(values)
     iqr = q3 - q1
-    if pd.isna(iqr) or iqr == 0:
+    if np.isnan(iqr) or iqr == 0:
         return 0
     lower = q1 - 1.5 * iqr
     upper = q3 + 1.5 * iqr
-    return int(((series < lower) | (series > upper)).sum())
+    return int(_count_outside(values, lower, upper))
+
+
+def _profile_column(name: Any, series: pd.Series) -> Dict[str, Any]:
+    unique_values = _unique_source(series)
+    uniques = _distinct_values(unique_values) if unique_values is not None else None
+    unique_count = _count_unique(series, uniques)
+    dtype = _dtype_name(series)
+    missing_count: Optional[int] = None
+    numeric_summary: Dict[str, Any] = {}
+    outlier_count = 0
+    if pd.api.types.is_numeric_dtype(series):
+        # Already numeric: read the buffer once as float64 instead of re-coercing.
+        values = series.to_numpy(dtype=np.float64, na_value=np.nan)
+        valid = values[~np.isnan(values)]
+        count, v_min, v_max, v_mean, v_std = _nan_stats(values, valid)
+        has_values = count > 0
+        numeric_summary = {
+            "min": float(v_min) if has_values else None,
+            "max": float(v_max) if has_values else None,
+            "mean": float(v_mean) if has_values else None,
+            "std": float(v_std) if has_values else None,
+        }
+        outlier_count = _iqr_outliers(valid)
+        missing_count = len(series) - int(valid.size)
+    # Reuse what the passes above already know instead of another isna() scan:
+    # the NaN mask for numeric columns, Arrow's stored null count otherwise.
+    if missing_count is None:
+        missing_count = unique_values.null_count if unique_values is not None else int(series.isna().sum())
+    missing_percent = float(missing_count / max(len(series), 1))
+    return ColumnProfile(
+        name=name,
+        dtype=dtype,
+        missing_count=missing_count,
+        missing_percent=missing_percent,
+        unique_count=unique_count,
+        sample_values=_safe_sample(series, uniques=uniques),
+        numeric_summary=numeric_summary,
+        outlier_count=outlier_count,
+    ).__dict__
 
 
 def profile_dataframe(df: pd.DataFrame) -> Dict[str, Any]:
-    profiles: List[Dict[str, Any]] = []
-    for col in df.columns:
-        series = df[col]
-        missing_count = int(series.isna().sum())
-        missing_percent = float(missing_count / max(len(series), 1))
-        unique_count = int(series.nunique(dropna=True))
-        dtype = str(series.dtype)
-        numeric_summary: Dict[str, Any] = {}
-        outlier_count = 0
-        if pd.api.types.is_numeric_dtype(series):
-            numeric_series = pd.to_numeric(series, errors="coerce")
-            numeric_summary = {
-                "min": float(np.nanmin(numeric_series)) if numeric_series.notna().any() else None,
-                "max": float(np.nanmax(numeric_series)) if numeric_series.notna().any() else None,
-                "mean": float(np.nanmean(numeric_series)) if numeric_series.notna().any() else None,
-                "std": float(np.nanstd(numeric_series)) if numeric_series.notna().any() else None,
-            }
-            outlier_count = _iqr_outliers(numeric_series.dropna())
-        profiles.append(
-            ColumnProfile(
-                name=col,
-                dtype=dtype,
-                missing_count=missing_count,
-                missing_percent=missing_percent,
-                unique_count=unique_count,
-                sample_values=_safe_sample(series),
-                numeric_summary=numeric_summary,
-                outlier_count=outlier_count,
-            ).__dict__
-        )
+    columns = list(df.columns)
+    workers = min(len(columns), os.cpu_count() or 1)
+    if workers > 1:
+        # Columns are independent and the heavy kernels release the GIL.
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            profiles = list(pool.map(_profile_column, columns, [df[col] for col in columns]))
+    else:
+        profiles = [_profile_column(col, df[col]) for col in columns]
 
     return {
         "row_count": int(len(df)),
@@ -89,11 +287,12 @@ def infer_column_type(series: pd.Series) -> Tuple[str, Dict[str, Any]]:
     if non_null.empty:
         return "string", diagnostics
 
-    numeric_coerce = pd.to_numeric(non_null, errors="coerce")
-    numeric_ratio = float(numeric_coerce.notna().mean())
+    numeric_coerce = _coerce_numeric(non_null)
+    numeric_ratio = float((~np.isnan(numeric_coerce)).mean())
 
-    datetime_coerce = pd.to_datetime(non_null, errors="coerce", utc=False)
-    datetime_ratio = float(datetime_coerce.notna().mean())
+    # utc=True: mixed offsets would otherwise raise instead of parsing.
+    datetime_coerce = _coerce_datetime(non_null)
+    datetime_ratio = float((~np.isnat(datetime_coerce)).mean())
 
     diagnostics["numeric_ratio"] = numeric_ratio
     diagnostics["datetime_ratio"] = datetime_ratio
@@ -103,9 +302,8 @@ def infer_column_type(series: pd.Series) -> Tuple[str, Dict[str, Any]]:
     if numeric_ratio >= 0.9:
         return "numeric", diagnostics
 
-    lowered = non_null.astype(str).str.lower()
-    bool_set = {"true", "false", "0", "1", "yes", "no"}
-    bool_ratio = float(lowered.isin(bool_set).mean())
+    lowered = _as_str(non_null).str.lower()
+    bool_ratio = float(lowered.isin(_BOOL_TOKENS).mean())
     diagnostics["boolean_ratio"] = bool_ratio
     if bool_ratio >= 0.9:
         return "boolean", diagnostics
@@ -113,27 +311,78 @@ def infer_column_type(series: pd.Series) -> Tuple[str, Dict[str, Any]]:
     return "string", diagnostics
 
 
+def _infer_arrow_string_type(values: Any) -> Optional[str]:
+    """Infer a coarse type for an Arrow string array with compute kernels only.
+
+    Only positive matches are decided here. Returns None for anything else,
+    since pandas' parser accepts more datetime layouts than the formats above,
+    and infer_column_type then decides those columns.
+    """
+    non_null = len(values) - values.null_count
+    if non_null == 0:
+        return "string"
+
+    def ratio(mask: Any) -> float:
+        return float((pc.sum(mask).as_py() or 0) / non_null)
+
+    whole_seconds = pc.replace_substring_regex(values, _FRACTIONAL_SECONDS, r"\1")
+    parsed = None
+    for fmt in _DATETIME_FORMATS:
+        ok = pc.is_valid(pc.strptime(whole_seconds, format=fmt, unit="s", error_is_null=True))
+        parsed = ok if parsed is None else pc.or_(parsed, ok)
+    datetime_ratio = ratio(parsed)
+    if datetime_ratio >= 0.9:
+        return "datetime"
+    if datetime_ratio > 0:
+        return None
+    if ratio(pc.match_substring_regex(values, _NUMERIC_PATTERN, ignore_case=True)) >= 0.9:
+        return "numeric"
+
+    if ratio(pc.is_in(pc.utf8_lower(values), value_set=_ARROW_BOOL_TOKENS)) >= 0.9:
+        return "boolean"
+    return None
+
+
+def infer_all_columns(df: pd.DataFrame) -> Dict[str, str]:
+    """Infer a coarse type for every column, using Arrow kernels for text columns."""
+    inferred: Dict[str, str] = {}
+    for col in df.columns:
+        series = df[col]
+        if pa is not None and not pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series):
+            try:
+                values = pa.array(series, from_pandas=True)
+            except (pa.ArrowInvalid, pa.ArrowTypeError):
+                values = None
+            if values is not None and (pa.types.is_string(values.type) or pa.types.is_large_string(values.type)):
+                arrow_type = _infer_arrow_string_type(values)
+                if arrow_type is not None:
+                    inferred[col] = arrow_type
+                    continue
+        inferred[col] = infer_column_type(series)[0]
+    return inferred
+
+
 def detect_schema_violations(df: pd.DataFrame, inferred_schema: Dict[str, str]) -> Dict[str, Any]:
     violations: Dict[str, Any] = {}
     for col, col_type in inferred_schema.items():
         series = df[col]
         if col_type == "numeric":
-            coerced = pd.to_numeric(series, errors="coerce")
-            invalid = series.notna() & coerced.isna()
+            coerced = _coerce_numeric(series)
+            invalid = series.notna().to_numpy() & np.isnan(coerced)
             violations[col] = {
                 "invalid_count": int(invalid.sum()),
                 "invalid_percent": float(invalid.mean()),
             }
         elif col_type == "datetime":
-            coerced = pd.to_datetime(series, errors="coerce", utc=False)
-            invalid = series.notna() & coerced.isna()
+            coerced = _coerce_datetime(series)
+            invalid = series.notna().to_numpy() & np.isnat(coerced)
             violations[col] = {
                 "invalid_count": int(invalid.sum()),
                 "invalid_percent": float(invalid.mean()),
             }
         elif col_type == "boolean":
-            lowered = series.dropna().astype(str).str.lower()
-            invalid_count = int((~lowered.isin({"true", "false", "0", "1", "yes", "no"})).sum())
+            lowered = _as_str(series.dropna()).str.lower()
+            invalid_count = int((~lowered.isin(_BOOL_TOKENS)).sum())
             violations[col] = {
                 "invalid_count": invalid_count,
                 "invalid_percent": float(invalid_count / max(len(series), 1)),
@@ -146,6 +395,44 @@ def detect_schema_violations(df: pd.DataFrame, inferred_schema: Dict[str, str])
     return violations
 
 
+def _optional_float(value: Any) -> Optional[float]:
+    return None if pd.isna(value) else float(value)
+
+
+def _numpy_frame(df: pd.DataFrame, columns: List[Any]) -> pd.DataFrame:
+    """NumPy-backed copy of numeric columns, typed as the default pandas reader would.
+
+    Arrow's mean/std kernels round differently in the last digit, and the
+    report is not rounded.
+    """
+    converted: Dict[Any, np.ndarray] = {}
+    for col in columns:
+        series = df[col]
+        if _is_arrow_backed(series):
+            dtype = np.float64 if series.hasnans else series.dtype.numpy_dtype
+            converted[col] = series.to_numpy(dtype=dtype, na_value=np.nan)
+        else:
+            converted[col] = series.to_numpy()
+    return pd.DataFrame(converted, index=df.index)
+
+
+def _top_value(series: pd.Series) -> Tuple[Optional[str], Optional[float]]:
+    """Most frequent non-null value (as text) and its count."""
+    values = _arrow_values(series)
+    if values is not None:
+        # One hash pass with O(unique) memory; no sort and no astype(str) copy.
+        counts = pc.value_counts(values)
+        freq = pc.if_else(counts.field("values").is_valid(), counts.field("counts"), 0).to_numpy()
+        if not freq.size or freq.max() == 0:
+            return None, None
+        idx = int(freq.argmax())
+        return str(counts.field("values")[idx].as_py()), float(freq[idx])
+    top = _as_str(series).value_counts(dropna=True).head(1)
+    if top.empty:
+        return None, None
+    return top.index[0], float(top.iloc[0])
+
+
 def detect_drift(current: pd.DataFrame, baseline: pd.DataFrame) -> Dict[str, Any]:
     drift: Dict[str, Any] = {
         "numeric": {},
@@ -153,31 +440,38 @@ def detect_drift(current: pd.DataFrame, baseline: pd.DataFrame) -> Dict[str, Any
         "notes": [],
     }
     shared_cols = [c for c in current.columns if c in baseline.columns]
+    numeric_cols = [
+        c for c in shared_cols
+        if pd.api.types.is_numeric_dtype(current[c]) and pd.api.types.is_numeric_dtype(baseline[c])
+    ]
+    if numeric_cols:
+        # One frame-level reduction per statistic instead of per-column Python dispatch.
+        cur_numeric = _numpy_frame(current, numeric_cols)
+        base_numeric = _numpy_frame(baseline, numeric_cols)
+        cur_means = cur_numeric.mean()
+        base_means = base_numeric.mean()
+        cur_stds = cur_numeric.std(ddof=0)
+        base_stds = base_numeric.std(ddof=0)
+    numeric_set = set(numeric_cols)
     for col in shared_cols:
-        cur = current[col]
-        base = baseline[col]
-        if pd.api.types.is_numeric_dtype(cur) and pd.api.types.is_numeric_dtype(base):
-            cur_num = pd.to_numeric(cur, errors="coerce")
-            base_num = pd.to_numeric(base, errors="coerce")
-            cur_mean = float(np.nanmean(cur_num)) if cur_num.notna().any() else None
-            base_mean = float(np.nanmean(base_num)) if base_num.notna().any() else None
-            cur_std = float(np.nanstd(cur_num)) if cur_num.notna().any() else None
-            base_std = float(np.nanstd(base_num)) if base_num.notna().any() else None
+        if col in numeric_set:
+            cur_mean = _optional_float(cur_means[col])
+            base_mean = _optional_float(base_means[col])
             drift["numeric"][col] = {
                 "current_mean": cur_mean,
                 "baseline_mean": base_mean,
-                "current_std": cur_std,
-                "baseline_std": base_std,
+                "current_std": _optional_float(cur_stds[col]),
+                "baseline_std": _optional_float(base_stds[col]),
                 "mean_delta": None if (cur_mean is None or base_mean is None) else cur_mean - base_mean,
             }
         else:
-            cur_top = cur.astype(str).value_counts(dropna=True).head(1)
-            base_top = base.astype(str).value_counts(dropna=True).head(1)
+            cur_top, cur_freq = _top_value(current[col])
+            base_top, base_freq = _top_value(baseline[col])
             drift["categorical"][col] = {
-                "current_top": cur_top.index[0] if not cur_top.empty else None,
-                "current_top_freq": float(cur_top.iloc[0]) if not cur_top.empty else None,
-                "baseline_top": base_top.index[0] if not base_top.empty else None,
-                "baseline_top_freq": float(base_top.iloc[0]) if not base_top.empty else None,
+                "current_top": cur_top,
+                "current_top_freq": cur_freq,
+                "baseline_top": base_top,
+                "baseline_top_freq": base_freq,
             }
     if not shared_cols:
         drift["notes"].append("No shared columns between current and baseline datasets.")